@@ -67,14 +67,21 @@ an if-expression as you would do with `unittest.main()` or `doctest.testmod()`.
 """
 
 
+import concurrent.futures
+import contextlib
+import functools
 import inspect
+import io
 import itertools
+import operator
+import os
+import pickle
 import sys
 import types
 import typing
 
 
-def check(prop, max_tests=360, verbose=True, silent=False, types=[]):
+def check(prop, max_tests=360, verbose=True, silent=False, types=[], parallel=False):
     """
     Checks a property for several enumerated argument values.
     Properties must have type hints
@@ -116,6 +123,28 @@ def check(prop, max_tests=360, verbose=True, silent=False, types=[]):
         prop_sorted_wrong([1, 0])
     False
 
+    Since values are enumerated in size order,
+    the counterexample reported is already one of the smallest:
+    there is no need for a separate shrinking step,
+    even on nested types.
+
+    >>> def prop_total(xss: list[list[int]]) -> bool:
+    ...     return sum(map(sum, xss)) < 2
+    ...
+    >>> check(prop_total)
+    *** Failed! Falsifiable after 22 tests:
+        prop_total([[2]])
+    False
+
+    Finite domains are tested exhaustively:
+    enumeration stops once every value has been tried.
+
+    >>> def prop_and_commutes(p:bool, q:bool) -> bool:
+    ...     return (p and q) == (q and p)
+    >>> check(prop_and_commutes)
+    +++ OK, passed 4 tests (exhausted): prop_and_commutes
+    True
+
     >>> check(prop_sorted_twice, silent=True)
     True
 
@@ -126,31 +155,142 @@ def check(prop, max_tests=360, verbose=True, silent=False, types=[]):
     >>> check(lambda xs: sorted(sorted(xs)) == sorted(xs), types=[list[int]])
     +++ OK, passed 360 tests: <lambda>
     True
+
+    For expensive properties,
+    `parallel=True` splits tests across processes, one per CPU,
+    or across the given number of processes if an integer is passed.
+    The property and its arguments are sent to worker processes.
+    Properties that cannot be pickled, such as lambdas and closures,
+    are checked in the calling process instead.
+    The same counterexample is reported either way.
     """
     verbose = verbose and not silent
     clear, red, green, blue, yellow = _colour_escapes()
     if not types:
-        sig = inspect.signature(prop)
-        # print(f"Property's signature: {sig}")
-        ret = sig.return_annotation
+        ret, types = _annotations(prop)
         if ret != bool and not silent:
             print(f"{yellow}Warning{clear}: property's return value is {ret} and not {bool}")
-        types = [par.annotation for par in sig.parameters.values()]
-    es = [Enumerator[t] for t in types]
-    for i, args in enumerate(itertools.islice(Enumerator.product(*es), max_tests)):
-        if not prop(*args):
-            if not silent:
-                repr_args = ', '.join(map(repr, args))
-                print(f"*** Failed! Falsifiable after {i+1} tests:")
-                print(f"    {red}{prop.__name__}{clear}({repr_args})")
-            return False
+    tiers = Enumerator.product(*[Enumerator[t] for t in types]).tiers()
+    if parallel and _picklable(prop):
+        i, args = _run_tests_parallel(prop, tiers, max_tests, parallel)
+    else:
+        i, args = _run_tests(prop, tiers, max_tests)
+    if args is not None:
+        if not silent:
+            repr_args = ', '.join(map(repr, args))
+            print(f"*** Failed! Falsifiable after {i} tests:\n"
+                  f"    {red}{prop.__name__}{clear}({repr_args})")
+        return False
     if verbose:
-        i = i+1
         exhausted = " (exhausted)" if i < max_tests else ""
         print(f"+++ OK, passed {i} tests{exhausted}: {green}{prop.__name__}{clear}")
     return True
 
 
+def _run_tests(prop, tiers, max_tests):
+    """
+    Tests a property over tiers of argument tuples.
+    Returns the number of tests run
+    and the falsifying arguments, or `None` if there are none.
+
+    >>> _run_tests(lambda x: x < 3, iter([[(0,), (1,)], [(2,), (3,)]]), 360)
+    (4, (3,))
+    >>> _run_tests(lambda x: x < 3, iter([[(0,), (1,)], [(2,), (3,)]]), 3)
+    (3, None)
+    """
+    i = 0
+    # Tests are run a whole tier at a time,
+    # only pinpointing arguments in the case of failure.
+    for tier in tiers:
+        j = _find_failure(prop, itertools.islice(tier, max_tests - i))
+        if j is not None:
+            return i+j+1, tier[j]
+        i = min(i + len(tier), max_tests)
+        if i == max_tests:
+            break
+    return i, None
+
+
+def _run_tests_parallel(prop, tiers, max_tests, parallel):
+    """
+    Like `_run_tests()` but splitting tests across worker processes.
+    Arguments are split in consecutive chunks
+    so that the first falsifying arguments are still the ones reported.
+    """
+    argss = list(itertools.islice(_to_list(tiers), max_tests))
+    workers = _workers(parallel)
+    size = max(1, -(-len(argss) // (4 * workers)))
+    starts = range(0, len(argss), size)
+    chunks = [argss[k:k+size] for k in starts]
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
+        for k, j in zip(starts, executor.map(_find_failure, itertools.repeat(prop), chunks)):
+            if j is not None:
+                executor.shutdown(cancel_futures=True)
+                return k+j+1, argss[k+j]
+    return len(argss), None
+
+
+def _workers(parallel):
+    """
+    Returns the number of worker processes for a `parallel=` argument:
+    one per CPU for `True`, otherwise the given number.
+
+    >>> _workers(3)
+    3
+    >>> _workers(True) >= 1
+    True
+    >>> _workers(-1)
+    Traceback (most recent call last):
+    ...
+    ValueError: parallel should be True or a positive number of workers, not -1
+    """
+    if parallel is True:
+        return os.cpu_count() or 1
+    if not isinstance(parallel, int) or parallel < 1:
+        raise ValueError(f"parallel should be True or a positive number of workers, not {parallel!r}")
+    return parallel
+
+
+def _annotations(prop):
+    """
+    Returns the return annotation and the parameter annotations of a function.
+
+    >>> def prop_commute(x:int, y:int) -> bool:
+    ...     return x + y == y + x
+    >>> _annotations(prop_commute)
+    (<class 'bool'>, (<class 'int'>, <class 'int'>))
+
+    Only parameters that can be passed positionally are listed,
+    as those are the ones check() enumerates:
+
+    >>> def prop_bounded(x:int, *, limit:int = 10) -> bool:
+    ...     return x < limit
+    >>> _annotations(prop_bounded)
+    (<class 'bool'>, (<class 'int'>,))
+    """
+    sig = inspect.signature(prop)
+    return sig.return_annotation, tuple(par.annotation for par in sig.parameters.values()
+                                        if par.kind in _positional)
+
+
+_positional = frozenset({inspect.Parameter.POSITIONAL_ONLY, inspect.Parameter.POSITIONAL_OR_KEYWORD})
+
+
+def _find_failure(prop, argss):
+    """
+    Returns the index of the first tuple of arguments falsifying a property
+    or `None` when the property holds for all of them.
+
+    >>> _find_failure(lambda x, y: x < y, [(0, 1), (1, 2), (2, 0), (3, 0)])
+    2
+    >>> _find_failure(lambda x, y: x < y, [(0, 1), (1, 2)]) is None
+    True
+    """
+    results = itertools.starmap(prop, argss)
+    failures = itertools.compress(itertools.count(), map(operator.not_, results))
+    return next(failures, None)
+
+
 def holds(prop, max_tests=360):
     """
     Alias to `check(prop, silent=True)`.
@@ -170,7 +310,7 @@ def holds(prop, max_tests=360):
     return check(prop, max_tests=max_tests, silent=True)
 
 
-def main(max_tests=360, silent=False, verbose=False, exit_on_failure=True):
+def main(max_tests=360, silent=False, verbose=False, exit_on_failure=True, parallel=False):
     """
     Tests all properties present in the current file,
     report results and
@@ -181,8 +321,11 @@ def main(max_tests=360, silent=False, verbose=False, exit_on_failure=True):
 
         if __name__ == '__main__':
             leancheck.main()
+
+    Use `parallel=True` to test properties in several processes
+    (see `testmod()`).
     """
-    n_failures, n_properties = testmod(max_tests=max_tests, silent=silent, verbose=verbose)
+    n_failures, n_properties = testmod(max_tests=max_tests, silent=silent, verbose=verbose, parallel=parallel)
     clear, red, green, blue, yellow = _colour_escapes()
     if not silent:
         if not n_properties:
@@ -195,7 +338,7 @@ def main(max_tests=360, silent=False, verbose=False, exit_on_failure=True):
         sys.exit(1)
 
 
-def testmod(max_tests=360, silent=False, verbose=False):
+def testmod(max_tests=360, silent=False, verbose=False, parallel=False):
     """
     Tests all properties present in the current file
     and report the results.
@@ -210,23 +353,80 @@ def testmod(max_tests=360, silent=False, verbose=False):
 
     Depending on your use-case
     you may be better off calling `leancheck.main()` instead.
+
+    With `parallel=True`, properties are tested on a pool of processes,
+    one per CPU.  An integer can be given instead to set the number of
+    worker processes.  Results are still reported in the order
+    properties appear in the file.  Properties that cannot be pickled,
+    such as closures, are checked in the calling process.  As with
+    `multiprocessing`, the call should be guarded by
+    `if __name__ == '__main__':`.
     """
     n_failures = 0
     n_properties = 0
     def lineno(m):
         try:
-            return m[1].__code__.co_firstlineno
+            return m[1].__code__.co_firstlineno, m[0]
         except AttributeError:
-            return -1
-    for name, member in sorted(inspect.getmembers(sys.modules["__main__"]), key=lineno):
-        if name.startswith("prop_") and callable(member):
+            return -1, m[0]
+    # Only prop_ names are looked at,
+    # other members of __main__ are never touched.
+    members = [(name, member) for name, member in vars(sys.modules["__main__"]).items()
+               if name.startswith("prop_") and callable(member)]
+    props = [member for name, member in sorted(members, key=lineno)]
+    if parallel:
+        tty = sys.stdout.isatty()
+        with concurrent.futures.ProcessPoolExecutor(max_workers=_workers(parallel)) as executor:
+            # Properties that cannot be sent to workers,
+            # closures for instance, are checked here instead.
+            futures = [executor.submit(_check_captured, prop, max_tests, silent, verbose, tty)
+                       if _picklable(prop) else None
+                       for prop in props]
+            for prop, future in zip(props, futures):
+                if future is None:
+                    passed = check(prop, max_tests=max_tests, silent=silent, verbose=verbose)
+                else:
+                    passed, output = future.result()
+                    print(output, end='')
+                n_properties += 1
+                if not passed:
+                    n_failures += 1
+    else:
+        for prop in props:
             n_properties += 1
-            passed = check(member, max_tests=max_tests, silent=silent, verbose=verbose)
+            passed = check(prop, max_tests=max_tests, silent=silent, verbose=verbose)
             if not passed:
                 n_failures += 1
     return (n_failures, n_properties) # just like doctest.testmod()
 
 
+def _check_captured(prop, max_tests, silent, verbose, tty):
+    "Checks a property returning its result along with what it would print."
+    output = _Captured(tty)
+    with contextlib.redirect_stdout(output):
+        passed = check(prop, max_tests=max_tests, silent=silent, verbose=verbose)
+    return passed, output.getvalue()
+
+
+class _Captured(io.StringIO):
+    "Captured output, coloured as if printed to a terminal when `tty` is set."
+    def __init__(self, tty):
+        super().__init__()
+        self._tty = tty
+
+    def isatty(self):
+        return self._tty
+
+
+def _picklable(obj):
+    "Whether an object can be sent to a worker process."
+    try:
+        pickle.dumps(obj)
+    except (pickle.PicklingError, TypeError, AttributeError):
+        return False
+    return True
+
+
 class Enumerator:
     """
     This class enumerates test values.
@@ -268,12 +468,18 @@ class Enumerator:
     [(0, False), (0, True), (1, False), (1, True), (2, False), (2, True), ...]
     """
 
+    __slots__ = ('tiers',)
+
     tiers: typing.Callable[[], typing.Generator]
     """
     Generate tiers of values.
 
     >>> list(Enumerator[bool].tiers())
     [[False, True]]
+
+    Each call generates fresh values,
+    so a test that mutates its arguments
+    does not affect later tests.
     """
 
     def __init__(self, tiers):
@@ -364,20 +570,51 @@ class Enumerator:
         """
         return Enumerator(lambda: _pproduct(self.tiers(), other.tiers()))
 
+    _repr_length = 6
+    _str_length = 6
+
     def __repr__(self):
-        # TODO: remove magic numbers: make them configurable?
-        xss = [str(xs) for xs in itertools.islice(self.tiers(), 7)]
-        if (len(xss) > 6):
-            xss[6] = "..."
+        n = self._repr_length
+        xss = [str(xs) for xs in itertools.islice(self.tiers(), n+1)]
+        if (len(xss) > n):
+            xss[n] = "..."
         return "Enumerator(lambda: (xs for xs in [" + ', '.join(xss) + "]))"
 
     def __str__(self):
-        # TODO: remove magic numbers: make them configurable?
-        xs = [str(x) for x in itertools.islice(self, 7)]
-        if (len(xs) > 6):
-            xs[6] = "..."
+        # Only the tiers needed for n+1 values are generated,
+        # but those are generated whole.
+        n = self._str_length
+        xs = [str(x) for x in itertools.islice(self, n+1)]
+        if (len(xs) > n):
+            xs[n] = "..."
         return "[" + ', '.join(xs) + "]"
 
+    @classmethod
+    def set_repr_length(cls, n):
+        """
+        Sets the number of tiers shown by `repr()` (default: 6).
+
+        >>> Enumerator.set_repr_length(3)
+        >>> Enumerator[int]
+        Enumerator(lambda: (xs for xs in [[0], [1], [2], ...]))
+        >>> Enumerator.set_repr_length(6)
+
+        Tiers are always shown whole.
+        """
+        cls._repr_length = _display_length(n)
+
+    @classmethod
+    def set_str_length(cls, n):
+        """
+        Sets the number of values shown by `str()` (default: 6).
+
+        >>> Enumerator.set_str_length(10)
+        >>> print(Enumerator[int])
+        [0, 1, 2, 3, 4, 5, 6, 7, 8, 9, ...]
+        >>> Enumerator.set_str_length(6)
+        """
+        cls._str_length = _display_length(n)
+
     def map(self, f):
         """
         Applies a function to all values in the enumeration.
@@ -387,6 +624,26 @@ class Enumerator:
         """
         return Enumerator(lambda: _mmap(f, self.tiers()))
 
+    def filter(self, predicate):
+        """
+        Keeps only values satisfying the given predicate.
+        Discarded values are never generated downstream,
+        so properties need not be called just to reject them.
+
+        >>> Enumerator[int].filter(lambda x: x % 2 == 0)
+        Enumerator(lambda: (xs for xs in [[0], [], [2], [], [4], [], ...]))
+
+        >>> print(Enumerator[list[int]].filter(lambda xs: xs != []))
+        [[0], [0, 0], [1], [0, 0, 0], [1, 0], [0, 1], ...]
+
+        Filtered tiers keep their place, even when empty.
+        So if the predicate rejects every value of an infinite enumeration,
+        looking for values never terminates:
+        iterating, printing or `check()`ing with it hangs,
+        and so do products and lists built on top of it.
+        """
+        return Enumerator(lambda: _ffilter(predicate, self.tiers()))
+
     @classmethod
     def product(cls, *enumerators):
         """
@@ -403,12 +660,41 @@ class Enumerator:
         """
         if len(enumerators) == 0:
             return Enumerator(lambda: (xs for xs in [[()]]))
+        elif len(enumerators) == 1:
+            [e] = enumerators
+            return e.map(lambda x: (x,))
+        elif len(enumerators) == 2:
+            e1, e2 = enumerators
+            return e1 * e2
         else:
+            # tuples are built in one step for each level
+            # instead of pairing then flattening
             e, *es = enumerators
-            return (e * cls.product(*es)).map(lambda t: (t[0],) + t[1])
+            p = cls.product(*es)
+            return Enumerator(lambda: _pproduct(e.tiers(), p.tiers(), with_f=lambda x, t: (x,) + t))
+
+    @classmethod
+    def sum(cls, *enumerators):
+        """
+        Computes the sum of several enumerators.
+
+        >>> print(Enumerator.sum(Enumerator[bool], Enumerator[int], Enumerator[list[int]]))
+        [False, True, 0, [], 1, [0], ...]
+
+        This is the same as chaining `+`,
+        but values are not passed through one sum per enumerator:
+
+        >>> print(Enumerator[bool] + Enumerator[int] + Enumerator[list[int]])
+        [False, True, 0, [], 1, [0], ...]
+        """
+        return Enumerator(lambda: _zippend(*(e.tiers() for e in enumerators)))
 
     _enumerators = None
 
+    # Enumerators already found by __class_getitem__, indexed by type.
+    # This is cleared whenever a new enumerator is registered.
+    _found: dict = {}
+
     # A hack!  Functions that use _enumerators, should first call this.
     @classmethod
     def _initialize(cls):
@@ -430,6 +716,7 @@ class Enumerator:
         """
         cls._initialize()
         cls._enumerators[c] = enumerator
+        cls._found.clear()
 
     # @classmethod # automatic
     def __class_getitem__(cls, c):
@@ -455,18 +742,31 @@ class Enumerator:
         Traceback (most recent call last):
         ...
         TypeError: could not find Enumerator for <class 'type'>
+
+        Lookups are memoized,
+        so asking twice for the same type
+        yields the very same enumerator:
+
+        >>> Enumerator[list[int]] is Enumerator[list[int]]
+        True
         """
         cls._initialize()
+        try:
+            return cls._found[c]
+        except KeyError:
+            pass
         try:
             if type(c) is types.GenericAlias:
                 origin = typing.get_origin(c)
                 args = typing.get_args(c)
                 enums = [Enumerator[a] for a in args]
-                return cls._enumerators[origin](*enums)
+                enumerator = cls._enumerators[origin](*enums)
             else:
-                return cls._enumerators[c]
+                enumerator = cls._enumerators[c]
         except KeyError as err:
             raise TypeError(f"could not find Enumerator for {c}") from err
+        cls._found[c] = enumerator
+        return enumerator
 
 
 # Declaration of some internal functions.
@@ -474,14 +774,29 @@ class Enumerator:
 # but for simplicity I am keeping them in a single one.
 
 
+def _display_length(n):
+    """
+    Validates a length given to `set_repr_length()` or `set_str_length()`.
+
+    >>> _display_length(0)
+    0
+    >>> _display_length(-2)
+    Traceback (most recent call last):
+    ...
+    ValueError: length should be a non-negative integer, not -2
+    """
+    if not isinstance(n, int) or n < 0:
+        raise ValueError(f"length should be a non-negative integer, not {n!r}")
+    return n
+
+
 def _to_tiers(xs):
     for x in xs:
         yield [x]
 
 
 def _to_list(xss):
-    for xs in xss:
-        yield from xs
+    return itertools.chain.from_iterable(xss)
 
 
 def _intercalate(generator1, generator2):
@@ -512,31 +827,52 @@ def _intercalate(generator1, generator2):
 
 
 def _zippend(*iiterables):
-    return map(list,itertools.starmap(itertools.chain,itertools.zip_longest(*iiterables, fillvalue=[])))
+    for xss in itertools.zip_longest(*iiterables, fillvalue=()):
+        zs = []
+        for xs in xss:
+            zs.extend(xs)
+        yield zs
 
 
 def _pproduct(xss, yss, with_f=None):
-    if with_f is None:
-        with_f = lambda x, y: (x,y)
     xss_ = []
     yss_ = []
+    x_exhausted = False
+    y_exhausted = False
     l = 0
     while True:
-        xss_.append(list(next(xss, [])))
-        yss_.append(list(next(yss, [])))
+        # Tiers are copied as they are buffered:
+        # they are read again for each diagonal
+        # and need not be re-iterable.
+        # Finite enumerations stop growing their buffers once exhausted.
+        if not x_exhausted:
+            xs = next(xss, None)
+            if xs is None:
+                x_exhausted = True
+                if not any(xss_):
+                    break  # no values: the product is empty
+            else:
+                xss_.append(list(xs))
+        if not y_exhausted:
+            ys = next(yss, None)
+            if ys is None:
+                y_exhausted = True
+                if not any(yss_):
+                    break  # no values: the product is empty
+            else:
+                yss_.append(list(ys))
         l += 1
-        zs = []
-        for i in range(0,l):
-            zs += [with_f(x,y) for x in xss_[i] for y in yss_[l-i-1]]
-        if zs == []:
-            # This is "sound-but-incomplete".
-            # TODO: in the final version, use None as a default value
-            # in the appends above
-            # and break only in the case where we
-            # end up with empty zs because of None values
-            # there's an opportunity for memory optimization here
-            # such as in the example of product between integers and booleans
-            break
+        if x_exhausted and y_exhausted and l >= len(xss_) + len(yss_):
+            break  # past the last pair of tiers
+        # only visit tier pairs that exist
+        diagonal = range(max(0, l-len(yss_)), min(l, len(xss_)))
+        if with_f is None:
+            # plain pairs are built by itertools in a single C loop
+            zs = list(itertools.chain.from_iterable(itertools.product(xss_[i], yss_[l-i-1]) for i in diagonal))
+        else:
+            zs = [with_f(x,y) for i in diagonal for x in xss_[i] for y in yss_[l-i-1]]
+        # Empty tiers are still yielded:
+        # later tiers may have values.
         yield zs
 
 
@@ -547,12 +883,38 @@ def _delay(xss):
 
 def _mmap(f,xss):
     for xs in xss:
-        yield [f(x) for x in xs]
+        yield list(map(f, xs))
+
+
+def _ffilter(p,xss):
+    for xs in xss:
+        yield list(filter(p, xs))
 
 
 def _llist(mkTiers):
+    # Tiers of lists are built iteratively:
+    # the n-th tier combines the i-th tier of elements
+    # with the (n-1-i)-th tier of lists already computed.
+    # Lists are kept as tuples internally and copied when yielded
+    # so that mutating a yielded list does not affect later tiers.
+    xss = mkTiers()
+    xss_ = []
+    lss_ = [[()]]
+    exhausted = False
     yield [[]]
-    yield from _pproduct(mkTiers(), _llist(mkTiers), with_f=lambda x, xs: xs + [x])
+    while True:
+        if not exhausted:
+            tier = next(xss, None)
+            if tier is None:
+                exhausted = True
+                if not any(xss_):
+                    break  # no elements: the empty list is the only list
+            else:
+                xss_.append(list(tier))
+        l = len(lss_)
+        ls = [(*xs, x) for i in range(min(l, len(xss_))) for x in xss_[i] for xs in lss_[l-i-1]]
+        lss_.append(ls)
+        yield list(map(list, ls))
 
 
 def _colour_escapes():
@@ -563,8 +925,16 @@ def _colour_escapes():
     >>> print(f"{red}This is red{clear} and {blue}this is blue{clear}.")
     This is red and this is blue.
     """
+    return _colour_escapes_for(sys.stdout)
+
+
+# Probing whether a stream is a terminal costs a system call,
+# so the answer is remembered for the current standard output.
+# Keying on the stream still honours redirections.
+@functools.lru_cache(maxsize=1)
+def _colour_escapes_for(stdout):
     plats = ['linux'] # TODO: add other supported platforms
-    supported = sys.stdout.isatty() and sys.platform in plats
+    supported = stdout.isatty() and sys.platform in plats
     if supported:
         return '\x1b[m', '\x1b[1;31m', '\x1b[32m', '\x1b[34m', '\x1b[33m'
     else:
@@ -8,7 +8,17 @@
 
 import unittest
 import itertools
-from leancheck import Enumerator
+import contextlib
+import io
+import concurrent.futures
+import os
+import subprocess
+import sys
+import tempfile
+import textwrap
+import time
+import leancheck
+from leancheck import Enumerator, check
 
 
 def take(n, generator):
@@ -24,6 +34,18 @@ def take(n, generator):
     return list(itertools.islice(generator, n))
 
 
+def prop_sorted_wrong(xs: list[int]) -> bool:
+    return sorted(xs) == xs
+
+
+def prop_sorted_twice(xs: list[int]) -> bool:
+    return sorted(sorted(xs)) == sorted(xs)
+
+
+def prop_sum_small(x: int, y: int) -> bool:
+    return x + y < 17
+
+
 class TestLeanCheck(unittest.TestCase):
 
     def assertEnum(self, typ, lst):
@@ -34,6 +56,59 @@ class TestLeanCheck(unittest.TestCase):
         self.assertEqual(list(e), [3,1,3,3,7])
         self.assertEqual(list(e.tiers()), [[3],[1],[3],[3],[7]])
     
+    def test_mutated_arguments(self):
+        def prop_reverse(xs: list[int]) -> bool:
+            xs.sort(reverse=True)
+            return True
+        self.assertTrue(check(prop_reverse, max_tests=50, silent=True))
+        self.assertEnum(list[int], [[], [0], [0, 0], [1], [0, 0, 0], [1, 0]])
+        tiers = Enumerator[list[int]].tiers()
+        for tier in itertools.islice(tiers, 4):
+            for xs in tier:
+                xs.sort(reverse=True)
+        self.assertEqual(next(tiers), [[0, 0, 0, 0], [1, 0, 0], [0, 1, 0], [2, 0], [0, 0, 1], [1, 1], [0, 2], [3]])
+
+    def test_independent_checks(self):
+        def prop_clear(xs: list[int]) -> bool:
+            xs.clear()
+            return True
+        def prop_sorted_pair(xs: list[int], y: int) -> bool:
+            return sorted(xs) == xs
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            check(prop_sorted_pair)
+            check(prop_clear)
+            check(prop_sorted_pair)
+        self.assertEqual(output.getvalue().count("Falsifiable after 13 tests"), 2)
+        self.assertEqual(output.getvalue().count("prop_sorted_pair([1, 0], 0)"), 2)
+
+    def test_check_registered_tuple(self):
+        def prop_pair(x: int, y: bool) -> bool:
+            return x >= 0
+        Enumerator.register(tuple, lambda *es: Enumerator.from_choices([("x",)]))
+        try:
+            self.assertTrue(check(prop_pair, silent=True))
+        finally:
+            Enumerator.register(tuple, lambda *es: Enumerator.product(*es))
+
+    def test_failing_tiers(self):
+        def tiers():
+            yield [0]
+            raise ZeroDivisionError
+        e = Enumerator(tiers)
+        for _ in range(2):
+            with self.assertRaises(ZeroDivisionError):
+                list(e)
+
+    def test_threads(self):
+        def slow_double(x):
+            time.sleep(0.001)
+            return 2 * x
+        e = Enumerator[int].map(slow_double)
+        with concurrent.futures.ThreadPoolExecutor(4) as executor:
+            results = list(executor.map(lambda n: take(n, e), [20] * 4))
+        self.assertEqual(results, [list(range(0, 40, 2))] * 4)
+
     def test_from_list(self):
         e = Enumerator.from_list([3,1,3,3,7])
         self.assertEqual(list(e), [3,1,3,3,7])
@@ -56,6 +131,161 @@ class TestLeanCheck(unittest.TestCase):
         self.assertEqual(list(e), [()])
         self.assertEqual(list(e.tiers()), [[()]])
 
+    def test_filter(self):
+        e = Enumerator[int].filter(lambda x: x % 3 == 0)
+        self.assertEqual(take(4, e), [0, 3, 6, 9])
+        self.assertEqual(take(4, e.tiers()), [[0], [], [], [3]])
+        self.assertEqual(take(4, Enumerator[list[bool]].filter(any)), [[True], [True,False], [False,True], [True,True]])
+
+    def test_filter_combined(self):
+        class Even(int):
+            pass
+        evens = Enumerator[int].filter(lambda x: x % 2 == 0)
+        Enumerator.register(Even, evens)
+        self.assertEqual(take(6, evens * evens), [(0, 0), (0, 2), (2, 0), (0, 4), (2, 2), (4, 0)])
+        self.assertEqual(take(6, Enumerator.lists(evens)), [[], [0], [0, 0], [0, 0, 0], [2], [0, 0, 0, 0]])
+        def prop_sum_even(x: Even, y: Even) -> bool:
+            return (x + y) % 2 == 0
+        def prop_sum_small(x: Even, y: Even) -> bool:
+            return x + y < 6
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            self.assertTrue(check(prop_sum_even))
+            self.assertFalse(check(prop_sum_small))
+        self.assertIn("+++ OK, passed 360 tests: prop_sum_even", output.getvalue())
+        self.assertIn("prop_sum_small(0, 6)", output.getvalue())
+
+    def test_product(self):
+        e = Enumerator(lambda: (xs for xs in [[0], [], [1]]))
+        self.assertEqual(list(Enumerator.product(e)), [(0,), (1,)])
+        self.assertEqual(take(6, Enumerator.product(Enumerator[int], Enumerator[bool], Enumerator[int])),
+                         [(0, False, 0), (0, True, 0), (0, False, 1), (0, True, 1), (1, False, 0), (1, True, 0)])
+
+    def test_sum(self):
+        e = Enumerator(lambda: (xs for xs in [[0], [], [1]]))
+        self.assertEqual(list(Enumerator.sum()), [])
+        self.assertEqual(list(Enumerator.sum(e)), [0, 1])
+        self.assertEqual(next(Enumerator.sum(e, Enumerator[bool], e).tiers()), [0, False, True, 0])
+        self.assertEqual(take(8, Enumerator.sum(Enumerator[int], e, Enumerator[list[bool]])),
+                         take(8, Enumerator[int] + e + Enumerator[list[bool]]))
+
+    def test_empty_tiers(self):
+        e = Enumerator(lambda: (xs for xs in [[0], [], [1]]))
+        self.assertEqual(list(e * e), [(0, 0), (0, 1), (1, 0), (1, 1)])
+        self.assertEqual(take(5, Enumerator.lists(e)), [[], [0], [0, 0], [0, 0, 0], [1]])
+        evens = Enumerator[int].filter(lambda x: x % 2 == 0)
+        self.assertEqual(take(4, evens * evens), [(0, 0), (0, 2), (2, 0), (0, 4)])
+        empty = Enumerator(lambda: (xs for xs in [[], []]))
+        self.assertEqual(list(empty * Enumerator[int]), [])
+        self.assertEqual(list(Enumerator.lists(empty)), [[]])
+
+    def test_iterator_tiers(self):
+        e = Enumerator(lambda: (iter([i]) for i in itertools.count()))
+        self.assertEqual(take(6, e * e), [(0, 0), (0, 1), (1, 0), (0, 2), (1, 1), (2, 0)])
+        self.assertEqual(take(6, Enumerator.lists(e)), [[], [0], [0, 0], [1], [0, 0, 0], [1, 0]])
+        class Iterated(int):
+            pass
+        Enumerator.register(Iterated, e)
+        def prop_small(x: Iterated, y: Iterated) -> bool:
+            return x + y < 2
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            self.assertFalse(check(prop_small))
+        self.assertIn("Falsifiable after 4 tests:\n    prop_small(0, 2)", output.getvalue())
+
+    def test_lookup_cache(self):
+        self.assertIs(Enumerator[list[int]], Enumerator[list[int]])
+        self.assertIs(Enumerator[tuple[int,bool]], Enumerator[tuple[int,bool]])
+
+    def test_register_invalidates_cache(self):
+        class Suit:
+            pass
+        Enumerator.register(Suit, Enumerator.from_list(["clubs", "hearts"]))
+        self.assertEnum(list[Suit], [[], ["clubs"], ["clubs", "clubs"], ["hearts"], ["clubs", "clubs", "clubs"], ["hearts", "clubs"]])
+        Enumerator.register(Suit, Enumerator.from_choices(["spades"]))
+        self.assertEnum(list[Suit], [[], ["spades"], ["spades", "spades"], ["spades", "spades", "spades"], ["spades", "spades", "spades", "spades"], ["spades", "spades", "spades", "spades", "spades"]])
+
+    def test_check_unhashable(self):
+        class Prop:
+            __hash__ = None
+            def __call__(self, x: int) -> bool:
+                return x < 10
+        self.assertFalse(check(Prop(), silent=True))
+
+    def test_check_parallel(self):
+        self.assertTrue(check(prop_sorted_twice, silent=True, parallel=2))
+        self.assertFalse(check(prop_sorted_wrong, silent=True, parallel=2))
+        # the counterexample is past the first chunk of arguments
+        def output(**kwargs):
+            captured = io.StringIO()
+            with contextlib.redirect_stdout(captured):
+                check(prop_sum_small, **kwargs)
+            return captured.getvalue()
+        sequential = output()
+        self.assertIn("Falsifiable after 154 tests", sequential)
+        self.assertEqual(output(parallel=2), sequential)
+        self.assertEqual(output(parallel=3, max_tests=100), output(max_tests=100))
+        with self.assertRaises(ValueError):
+            check(prop_sum_small, parallel=-1)
+
+    def test_check_parallel_unpicklable(self):
+        def prop_closure(x: int, y: int) -> bool:
+            return x + y < 17
+        def output(prop, **kwargs):
+            captured = io.StringIO()
+            with contextlib.redirect_stdout(captured):
+                check(prop, **kwargs)
+            return captured.getvalue()
+        self.assertEqual(output(prop_closure, parallel=2), output(prop_closure))
+        prop_lambda = lambda xs: sorted(sorted(xs)) == sorted(xs)
+        self.assertEqual(output(prop_lambda, types=[list[int]], parallel=2),
+                         "+++ OK, passed 360 tests: <lambda>\n")
+
+    def test_check_keyword_only(self):
+        def prop_bounded(x: int, *, limit: int = 360) -> bool:
+            return x < limit
+        self.assertTrue(check(prop_bounded, silent=True))
+        self.assertFalse(check(prop_bounded, max_tests=361, silent=True))
+
+    def test_main_parallel(self):
+        script = textwrap.dedent("""
+            import sys
+            import leancheck
+
+            def prop_commute(x: int, y: int) -> bool:
+                return x + y == y + x
+
+            def make_prop():
+                def prop_sorted(xs: list[int]) -> bool:
+                    return sorted(xs) == xs
+                return prop_sorted
+
+            prop_closure = make_prop()  # unpicklable
+
+            def prop_sum(x: int, y: int) -> bool:
+                return x + y < 17
+
+            if __name__ == '__main__':
+                parallel = int(sys.argv[1]) if sys.argv[1:] else False
+                leancheck.main(verbose=True, parallel=parallel)
+        """)
+        env = dict(os.environ, PYTHONPATH=os.path.dirname(leancheck.__file__))
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "props.py")
+            with open(path, "w") as f:
+                f.write(script)
+            def run(*args):
+                return subprocess.run([sys.executable, path, *args], env=env,
+                                      capture_output=True, text=True)
+            sequential = run()
+            parallel = run("2")
+        self.assertEqual(sequential.returncode, 1)
+        self.assertIn("prop_sum(0, 17)", sequential.stdout)
+        self.assertIn("*** 2 of 3 properties failed", sequential.stdout)
+        self.assertEqual(parallel.returncode, sequential.returncode)
+        self.assertEqual(parallel.stdout, sequential.stdout)
+        self.assertEqual(parallel.stderr, "")
+
 
 if __name__ == '__main__':
     unittest.main()